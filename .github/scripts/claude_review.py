@@ -4,31 +4,116 @@ Claude Codebase Review Script
 Analyzes entire codebase and creates GitHub issues for findings
 """
 
+import asyncio
+import hashlib
+import mmap
 import os
 import sys
 import json
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import anthropic
-from github import Github
+import requests
+from github import Auth, Github, GithubException, RateLimitExceededException
 import yaml
 
+try:
+    import pathspec
+except ImportError:
+    pathspec = None  # Fall back to EXCLUDE_DIRS only
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard json module
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # Fall back to estimating tokens from length
+
 class ClaudeCodebaseReviewer:
+    # File types to review; a tuple so str.endswith can match them in one call
+    FILE_EXTENSIONS = ('.py', '.js', '.jsx', '.ts', '.tsx', '.json', '.yaml', '.yml', '.md')
+    EXCLUDE_DIRS = frozenset({'node_modules', '__pycache__', '.git', 'venv', 'dist', 'build', '.claude-review-cache'})
+    MAX_FILE_SIZE = 50000  # Skip very large files
+    MMAP_THRESHOLD = 8192  # Files above this size are read via mmap
+    MAX_RETRIES = 5
+    ISSUE_BATCH_SIZE = 10  # createIssue mutations sent per GraphQL request
+    
+    # Every label a review can apply, created up front if missing
+    LABEL_COLORS = {
+        'severity:critical': 'd73a4a',  # Red
+        'severity:high': 'e99695',      # Light red
+        'severity:medium': 'f9d71c',    # Yellow
+        'severity:low': '7bbe48',       # Green
+        'category:security': 'c5def5',
+        'category:performance': 'c5def5',
+        'category:quality': 'c5def5',
+        'category:architecture': 'c5def5',
+        'category:documentation': 'c5def5',
+        'category:bug': 'c5def5',
+        'claude-review': '0052cc',      # Blue
+        'automated': 'bfdadc',          # Light gray
+        'summary': 'c5def5',
+    }
+    MODEL = "claude-sonnet-4-20250514"
+    CACHE_DIR = Path('.claude-review-cache')
+    CACHE_MAX_AGE = 7 * 24 * 60 * 60  # Re-review unchanged chunks weekly
+    _encoder = None  # tiktoken encoding, loaded on first use (False if unavailable)
+    
+    # Forcing this tool makes Claude return findings as structured input
+    # rather than free text that has to be searched for JSON
+    REPORT_ISSUES_TOOL = {
+        "name": "report_issues",
+        "description": "Report the issues found while reviewing the files",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "issues": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "severity": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                            "category": {
+                                "type": "string",
+                                "enum": ["security", "performance", "quality", "architecture", "documentation", "bug"]
+                            },
+                            "title": {"type": "string", "description": "Brief title for the issue"},
+                            "description": {"type": "string", "description": "Detailed description"},
+                            "file": {"type": "string", "description": "path/to/file.py"},
+                            "line": {"type": "integer"},
+                            "suggestion": {"type": "string", "description": "How to fix this issue"}
+                        },
+                        "required": ["severity", "category", "title", "description"]
+                    }
+                }
+            },
+            "required": ["issues"]
+        }
+    }
+    
     def __init__(self):
         self.anthropic_key = os.environ.get('ANTHROPIC_API_KEY')
         self.github_token = os.environ.get('GITHUB_TOKEN')
         self.review_type = os.environ.get('REVIEW_TYPE', 'comprehensive')
         self.repo_name = os.environ.get('GITHUB_REPOSITORY', '48Nauts-Operator/hubble')
+        self.max_concurrency = int(os.environ.get('REVIEW_CONCURRENCY', '5'))
+        self.graphql_url = os.environ.get('GITHUB_GRAPHQL_URL', 'https://api.github.com/graphql')
         
         if not self.anthropic_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
         if not self.github_token:
             raise ValueError("GITHUB_TOKEN not set")
         
-        self.client = anthropic.Anthropic(api_key=self.anthropic_key)
-        self.github = Github(self.github_token)
-        self.repo = self.github.get_repo(self.repo_name)
+        # PyGithub's own retries are disabled so rate limit backoff happens
+        # only in _github_call
+        self.github = Github(auth=Auth.Token(self.github_token), retry=None)
         
         # Define review prompts
         self.review_prompts = {
@@ -94,57 +179,252 @@ class ClaudeCodebaseReviewer:
             """
         }
     
+    # The API clients below are created on first use, so runs that find no
+    # files or hit the review cache for every chunk never pay for them
+    
+    @cached_property
+    def client(self) -> anthropic.AsyncAnthropic:
+        """Anthropic client; retries are handled by _create_message so they follow rate limit headers"""
+        return anthropic.AsyncAnthropic(api_key=self.anthropic_key, max_retries=0)
+    
+    @cached_property
+    def repo(self):
+        """The GitHub repository issues are filed against"""
+        return self.github.get_repo(self.repo_name)
+    
+    @cached_property
+    def _labels(self) -> Dict[str, str]:
+        """Repository label node IDs by name, creating any LABEL_COLORS labels that are missing"""
+        # Fetch existing labels once so label checks don't each cost a request.
+        # Node IDs are kept because GraphQL mutations reference labels by ID.
+        try:
+            labels = self._github_call(
+                lambda: {label.name: label.node_id for label in self.repo.get_labels()}
+            )
+        except GithubException as e:
+            # Issues are still filed, just without labels
+            print(f"Could not fetch labels: {e}")
+            return {}
+        for label_name, color in self.LABEL_COLORS.items():
+            if label_name in labels:
+                continue
+            try:
+                label = self._github_call(self.repo.create_label, label_name, color)
+                labels[label.name] = label.node_id
+            except GithubException as e:
+                print(f"Could not create label {label_name}: {e}")
+        return labels
+    
+    def _load_gitignore(self):
+        """Parse the root .gitignore into a matcher, if pathspec is available"""
+        if pathspec is None:
+            return None
+        try:
+            with open('.gitignore', 'r', encoding='utf-8') as f:
+                return pathspec.GitIgnoreSpec.from_lines(f)
+        except OSError:
+            return None
+    
+    def _scan(self, path: str, ignore_spec=None):
+        """Recursively yield file entries matching FILE_EXTENSIONS"""
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir and entry.name in self.EXCLUDE_DIRS:
+                        continue
+                    if ignore_spec is not None:
+                        # Directories get a trailing slash so "dir/" patterns
+                        # match and whole ignored subtrees are never opened
+                        rel_path = os.path.relpath(entry.path)
+                        if ignore_spec.match_file(rel_path + '/' if is_dir else rel_path):
+                            continue
+                    if is_dir:
+                        yield from self._scan(entry.path, ignore_spec)
+                    elif entry.name.endswith(self.FILE_EXTENSIONS):
+                        yield entry
+        except OSError as e:
+            print(f"Skipping {path}: {e}")
+    
+    def _read_file(self, entry: os.DirEntry) -> Optional[Dict[str, str]]:
+        """Read a single file, returning None if it is too large or unreadable"""
+        try:
+            # Check the size before opening so large files are never read
+            size = entry.stat(follow_symlinks=False).st_size
+            if size >= self.MAX_FILE_SIZE:
+                return None
+            
+            # Never read past the cap, and skip rather than truncate a
+            # file that has grown beyond it since it was stat'ed
+            if size > self.MMAP_THRESHOLD:
+                # Larger files are decoded straight from the page cache
+                with open(entry.path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if len(mm) >= self.MAX_FILE_SIZE:
+                        return None
+                    # Match the universal newline handling of the text-mode path
+                    content = str(mm, 'utf-8', 'replace').replace('\r\n', '\n').replace('\r', '\n')
+            else:
+                # mmap setup costs more than it saves on small files
+                with open(entry.path, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read(self.MAX_FILE_SIZE)
+                if len(content) >= self.MAX_FILE_SIZE:
+                    return None
+            
+            return {
+                'path': entry.path,
+                'content': content
+            }
+        except Exception as e:
+            print(f"Skipping {entry.path}: {e}")
+            return None
+    
     def get_codebase_files(self) -> List[Dict[str, str]]:
         """Collect all relevant code files"""
-        files_content = []
-        extensions = ['.py', '.js', '.jsx', '.ts', '.tsx', '.json', '.yaml', '.yml', '.md']
-        exclude_dirs = {'node_modules', '__pycache__', '.git', 'venv', 'dist', 'build'}
-        
-        for root, dirs, files in os.walk('.'):
-            # Remove excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            
-            for file in files:
-                if any(file.endswith(ext) for ext in extensions):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if len(content) < 50000:  # Skip very large files
-                                files_content.append({
-                                    'path': file_path,
-                                    'content': content
-                                })
-                    except Exception as e:
-                        print(f"Skipping {file_path}: {e}")
-        
-        return files_content
+        entries = list(self._scan('.', self._load_gitignore()))
+        
+        # File reads are blocking I/O, so fan them out across threads.
+        # map() keeps results in walk order so chunking stays deterministic.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._read_file, entries)
+            return [file for file in results if file is not None]
+    
+    @classmethod
+    def _count_tokens(cls, text: str) -> int:
+        """Count tokens in text, estimating 1 token ≈ 4 characters without tiktoken"""
+        if cls._encoder is None:
+            cls._encoder = False
+            if tiktoken is not None:
+                # cl100k_base is not Claude's tokenizer, but it tracks it far
+                # more closely on source code than a fixed character ratio does
+                try:
+                    cls._encoder = tiktoken.get_encoding('cl100k_base')
+                except Exception as e:
+                    print(f"Estimating token counts, tokenizer unavailable: {e}")
+        if not cls._encoder:
+            return len(text) // 4
+        return len(cls._encoder.encode(text, disallowed_special=()))
     
     def chunk_files_for_review(self, files: List[Dict[str, str]], max_tokens: int = 50000) -> List[List[Dict[str, str]]]:
         """Split files into chunks that fit within token limits"""
+        # First-fit decreasing: placing the largest files first and letting
+        # smaller ones fill the gaps packs noticeably fewer chunks than a
+        # single greedy pass in walk order. Ties are broken by path because
+        # scandir order varies between filesystems, and chunk contents feed
+        # the review cache keys.
+        sized_files = sorted(
+            ((self._count_tokens(file['content']), file) for file in files),
+            key=lambda item: (-item[0], item[1]['path'])
+        )
+        
+        chunk_sizes = []
         chunks = []
-        current_chunk = []
-        current_size = 0
-        
-        for file in files:
-            # Rough estimate: 1 token ≈ 4 characters
-            file_tokens = len(file['content']) // 4
-            
-            if current_size + file_tokens > max_tokens:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = [file]
-                current_size = file_tokens
+        for file_tokens, file in sized_files:
+            for i, size in enumerate(chunk_sizes):
+                if size + file_tokens <= max_tokens:
+                    chunk_sizes[i] += file_tokens
+                    chunks[i].append(file)
+                    break
             else:
-                current_chunk.append(file)
-                current_size += file_tokens
-        
-        if current_chunk:
-            chunks.append(current_chunk)
+                chunk_sizes.append(file_tokens)
+                chunks.append([file])
         
         return chunks
     
-    def review_chunk(self, files_chunk: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _retry_delay(headers, attempt: int) -> float:
+        """Seconds to wait before retrying, based on rate limit headers when present"""
+        headers = headers or {}
+        retry_after = headers.get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        reset = headers.get('x-ratelimit-reset')
+        if reset:
+            return max(0.0, float(reset) - time.time())
+        return float(2 ** attempt)
+    
+    def _github_call(self, func, *args, **kwargs):
+        """Call a PyGithub method, sleeping only when GitHub reports a rate limit"""
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return func(*args, **kwargs)
+            except GithubException as e:
+                headers = e.headers or {}
+                rate_limited = isinstance(e, RateLimitExceededException) or (
+                    e.status in (403, 429)
+                    and ('retry-after' in headers or headers.get('x-ratelimit-remaining') == '0')
+                )
+                if not rate_limited or attempt == self.MAX_RETRIES - 1:
+                    raise
+                delay = self._retry_delay(headers, attempt)
+                print(f"   GitHub rate limit hit, retrying in {delay:.0f}s")
+                time.sleep(delay)
+    
+    async def _create_message(self, **kwargs):
+        """Call the Anthropic API, backing off only when it asks us to"""
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return await self.client.messages.create(**kwargs)
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                # Same statuses the SDK's own retries cover, including 529 overloaded
+                retryable = isinstance(e, anthropic.APIConnectionError) or (
+                    e.status_code in (408, 409, 429) or e.status_code >= 500
+                )
+                if not retryable or attempt == self.MAX_RETRIES - 1:
+                    raise
+                response = getattr(e, 'response', None)
+                delay = self._retry_delay(response.headers if response is not None else None, attempt)
+                print(f"   Anthropic API unavailable ({type(e).__name__}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Hash everything sent to Claude that determines a chunk's review result"""
+        key_source = "\0".join([
+            self.MODEL,
+            json.dumps(self.REPORT_ISSUES_TOOL, sort_keys=True),
+            prompt
+        ])
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def _load_cached_review(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached issues for a chunk, or None if missing or expired"""
+        path = self.CACHE_DIR / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.CACHE_MAX_AGE:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except (OSError, ValueError):
+            return None
+    
+    def _prune_review_cache(self):
+        """Delete expired cache entries so the persisted cache doesn't grow forever"""
+        if not self.CACHE_DIR.is_dir():
+            return
+        cutoff = time.time() - self.CACHE_MAX_AGE
+        for path in self.CACHE_DIR.glob('*.json'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError as e:
+                print(f"Could not remove expired cache entry {path}: {e}")
+    
+    def _save_cached_review(self, key: str, issues: List[Dict[str, Any]]):
+        """Store a chunk's issues so unchanged code is not re-reviewed"""
+        try:
+            self.CACHE_DIR.mkdir(exist_ok=True)
+            data = orjson.dumps(issues) if orjson else json.dumps(issues).encode('utf-8')
+            with open(self.CACHE_DIR / f"{key}.json", 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            print(f"Could not cache review: {e}")
+    
+    async def review_chunk(self, files_chunk: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Review a chunk of files with Claude"""
         # Prepare the code context
         code_context = "\\n\\n".join([
@@ -159,40 +439,42 @@ class ClaudeCodebaseReviewer:
         
         {code_context}
         
-        Please provide your findings in JSON format:
-        {{
-            "issues": [
-                {{
-                    "severity": "critical|high|medium|low",
-                    "category": "security|performance|quality|architecture|documentation|bug",
-                    "title": "Brief title for the issue",
-                    "description": "Detailed description",
-                    "file": "path/to/file.py",
-                    "line": 123,
-                    "suggestion": "How to fix this issue"
-                }}
-            ]
-        }}
+        Report your findings with the report_issues tool.
         """
         
+        # The key covers the full prompt and tool schema, so editing either
+        # invalidates cached results along with changes to the code
+        cache_key = self._cache_key(prompt)
+        cached_issues = self._load_cached_review(cache_key)
+        if cached_issues is not None:
+            return cached_issues
+        
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+            response = await self._create_message(
+                model=self.MODEL,
                 max_tokens=4000,
                 messages=[
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                tools=[self.REPORT_ISSUES_TOOL],
+                tool_choice={"type": "tool", "name": self.REPORT_ISSUES_TOOL["name"]}
             )
             
-            # Extract JSON from response
-            response_text = response.content[0].text
+            # Output cut off at max_tokens may be missing findings, so it is
+            # used for this run but never cached
+            truncated = response.stop_reason == "max_tokens"
+            if truncated:
+                print("   Review response hit max_tokens; results may be incomplete and will not be cached")
             
-            # Find JSON in response
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                issues_data = json.loads(json_match.group())
-                return issues_data.get('issues', [])
+            # The tool input is already parsed into a dict by the SDK
+            for block in response.content:
+                if block.type == 'tool_use':
+                    issues = block.input.get('issues', [])
+                    if not isinstance(issues, list):
+                        return []
+                    if not truncated:
+                        self._save_cached_review(cache_key, issues)
+                    return issues
             
             return []
             
@@ -200,20 +482,81 @@ class ClaudeCodebaseReviewer:
             print(f"Error reviewing chunk: {e}")
             return []
     
+    async def review_chunks(self, chunks: List[List[Dict[str, str]]]) -> List[Dict[str, Any]]:
+        """Review chunks concurrently, bounded by max_concurrency"""
+        self._prune_review_cache()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def worker(i: int, chunk: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                print(f"🔍 Reviewing chunk {i}/{len(chunks)}...")
+                issues = await self.review_chunk(chunk)
+                print(f"   Chunk {i}/{len(chunks)}: found {len(issues)} issues")
+                return issues
+        
+        results = await asyncio.gather(*[
+            worker(i, chunk) for i, chunk in enumerate(chunks, 1)
+        ])
+        return [issue for issues in results for issue in issues]
+    
+    def deduplicate_issues(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop issues reported more than once for the same file, line and title"""
+        seen = set()
+        unique_issues = []
+        for issue in issues:
+            key = (issue.get('file'), issue.get('line'), issue.get('title'))
+            if key not in seen:
+                seen.add(key)
+                unique_issues.append(issue)
+        return unique_issues
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GitHub GraphQL request, backing off when rate limited"""
+        for attempt in range(self.MAX_RETRIES):
+            response = requests.post(
+                self.graphql_url,
+                json={'query': query, 'variables': variables},
+                headers={'Authorization': f"bearer {self.github_token}"},
+                timeout=30
+            )
+            if response.ok:
+                # An exhausted GraphQL rate limit comes back as HTTP 200 with a
+                # RATE_LIMITED error. Only resend when no mutation in the batch
+                # ran; otherwise re-sending would file duplicate issues, so the
+                # partial result is returned and failed aliases are reported.
+                result = response.json()
+                rate_limited = any(
+                    error.get('type') == 'RATE_LIMITED'
+                    for error in result.get('errors') or []
+                ) and not any((result.get('data') or {}).values())
+            else:
+                result = None
+                rate_limited = response.status_code in (403, 429) and (
+                    'retry-after' in response.headers
+                    or response.headers.get('x-ratelimit-remaining') == '0'
+                )
+            if not rate_limited or attempt == self.MAX_RETRIES - 1:
+                response.raise_for_status()
+                return result
+            delay = self._retry_delay(response.headers, attempt)
+            print(f"   GitHub rate limit hit, retrying in {delay:.0f}s")
+            time.sleep(delay)
+    
     def create_github_issues(self, issues: List[Dict[str, Any]]):
         """Create GitHub issues from findings"""
         created_issues = []
         
-        # Group issues by severity
-        critical_issues = [i for i in issues if i.get('severity') == 'critical']
-        high_issues = [i for i in issues if i.get('severity') == 'high']
-        other_issues = [i for i in issues if i.get('severity') in ['medium', 'low']]
-        
-        # Create individual issues for critical and high severity
-        for issue in critical_issues + high_issues:
-            try:
-                title = f"[Claude Review] {issue['title']}"
-                body = f"""
+        # Group issues by severity in a single pass
+        by_severity = defaultdict(list)
+        for issue in issues:
+            by_severity[issue.get('severity')].append(issue)
+        other_issues = by_severity['medium'] + by_severity['low']
+        
+        # Build individual issues for critical and high severity
+        issue_inputs = []
+        for issue in by_severity['critical'] + by_severity['high']:
+            title = f"[Claude Review] {issue.get('title', 'Untitled finding')}"
+            body = f"""
 ## 🤖 Automated Code Review Finding
 
 **Severity:** {issue.get('severity', 'unknown').upper()}
@@ -231,30 +574,48 @@ class ClaudeCodebaseReviewer:
 *This issue was automatically created by Claude Code Review*
 *Review Type: {self.review_type}*
 """
-                
-                # Add labels
-                labels = [
-                    f"severity:{issue.get('severity', 'unknown')}",
-                    f"category:{issue.get('category', 'general')}",
-                    "claude-review",
-                    "automated"
-                ]
-                
-                # Create the issue
-                github_issue = self.repo.create_issue(
-                    title=title,
-                    body=body,
-                    labels=[l for l in labels if self.label_exists(l)]
+            
+            # Add labels
+            labels = [
+                f"severity:{issue.get('severity', 'unknown')}",
+                f"category:{issue.get('category', 'general')}",
+                "claude-review",
+                "automated"
+            ]
+            
+            issue_inputs.append({
+                'repositoryId': self.repo.node_id,
+                'title': title,
+                'body': body,
+                'labelIds': [self._labels[l] for l in labels if self.label_exists(l)]
+            })
+        
+        # Create the issues in batches, one GraphQL request per batch
+        for start in range(0, len(issue_inputs), self.ISSUE_BATCH_SIZE):
+            batch = issue_inputs[start:start + self.ISSUE_BATCH_SIZE]
+            aliases = [f"i{n}" for n in range(len(batch))]
+            query = "mutation({}) {{\n{}\n}}".format(
+                ", ".join(f"${alias}: CreateIssueInput!" for alias in aliases),
+                "\n".join(
+                    f"  {alias}: createIssue(input: ${alias}) {{ issue {{ number url }} }}"
+                    for alias in aliases
                 )
-                
-                created_issues.append(github_issue)
-                print(f"Created issue: {title}")
-                
-                # Rate limiting
-                time.sleep(2)
-                
+            )
+            
+            try:
+                result = self._graphql(query, dict(zip(aliases, batch)))
             except Exception as e:
-                print(f"Error creating issue: {e}")
+                print(f"Error creating issues: {e}")
+                continue
+            
+            for error in result.get('errors', []):
+                print(f"Error creating issue: {error.get('message')}")
+            
+            data = result.get('data') or {}
+            for alias, issue_input in zip(aliases, batch):
+                if data.get(alias):
+                    created_issues.append(data[alias]['issue'])
+                    print(f"Created issue: {issue_input['title']}")
         
         # Create a summary issue for medium/low severity items
         if other_issues:
@@ -267,36 +628,38 @@ class ClaudeCodebaseReviewer:
         title = f"[Claude Review] {len(issues)} Medium/Low Priority Findings"
         
         # Group by category
-        by_category = {}
+        by_category = defaultdict(list)
         for issue in issues:
-            cat = issue.get('category', 'general')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(issue)
+            by_category[issue.get('category', 'general')].append(issue)
         
-        body = f"""
+        parts = [f"""
 ## 🤖 Code Review Summary
 
 Found {len(issues)} medium/low priority issues during automated review.
 
 ### Findings by Category
-"""
+"""]
         
+        # Collect the pieces and join once instead of growing a string
         for category, cat_issues in by_category.items():
-            body += f"\\n#### {category.title()} ({len(cat_issues)} issues)\\n"
-            for issue in cat_issues[:10]:  # Limit to 10 per category
-                body += f"- **{issue.get('severity')}**: {issue.get('title')} "
-                body += f"(`{issue.get('file', 'N/A')}`)\\n"
+            parts.append(f"\\n#### {category.title()} ({len(cat_issues)} issues)\\n")
+            parts.extend(
+                f"- **{issue.get('severity')}**: {issue.get('title')} "
+                f"(`{issue.get('file', 'N/A')}`)\\n"
+                for issue in cat_issues[:10]  # Limit to 10 per category
+            )
         
-        body += """
+        parts.append("""
 
 ---
 *This summary was automatically created by Claude Code Review*
 *For detailed information on each issue, please run a targeted review*
-"""
+""")
+        body = "".join(parts)
         
         try:
-            self.repo.create_issue(
+            self._github_call(
+                self.repo.create_issue,
                 title=title,
                 body=body,
                 labels=["claude-review", "automated", "summary"]
@@ -307,28 +670,13 @@ Found {len(issues)} medium/low priority issues during automated review.
     
     def label_exists(self, label_name: str) -> bool:
         """Check if a label exists in the repository"""
-        try:
-            self.repo.get_label(label_name)
-            return True
-        except:
-            # Try to create the label
-            try:
-                color_map = {
-                    'severity:critical': 'd73a4a',  # Red
-                    'severity:high': 'e99695',      # Light red
-                    'severity:medium': 'f9d71c',    # Yellow
-                    'severity:low': '7bbe48',       # Green
-                    'claude-review': '0052cc',      # Blue
-                    'automated': 'bfdadc',          # Light gray
-                }
-                color = color_map.get(label_name, 'c5def5')  # Default purple
-                self.repo.create_label(label_name, color)
-                return True
-            except:
-                return False
+        return label_name in self._labels
     
     def generate_summary_report(self, all_issues: List[Dict[str, Any]]):
         """Generate a summary report for GitHub Actions"""
+        severities = Counter(i.get('severity') for i in all_issues)
+        categories = Counter(i.get('category', 'general') for i in all_issues)
+        
         report = f"""
 # Claude Code Review Report
 
@@ -336,21 +684,14 @@ Found {len(issues)} medium/low priority issues during automated review.
 **Total Issues Found**: {len(all_issues)}
 
 ## Summary by Severity
-- Critical: {len([i for i in all_issues if i.get('severity') == 'critical'])}
-- High: {len([i for i in all_issues if i.get('severity') == 'high'])}
-- Medium: {len([i for i in all_issues if i.get('severity') == 'medium'])}
-- Low: {len([i for i in all_issues if i.get('severity') == 'low'])}
+- Critical: {severities['critical']}
+- High: {severities['high']}
+- Medium: {severities['medium']}
+- Low: {severities['low']}
 
 ## Summary by Category
 """
-        
-        categories = {}
-        for issue in all_issues:
-            cat = issue.get('category', 'general')
-            categories[cat] = categories.get(cat, 0) + 1
-        
-        for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-            report += f"- {cat.title()}: {count}\\n"
+        report += "".join(f"- {cat.title()}: {count}\\n" for cat, count in categories.most_common())
         
         # Write to file for GitHub Actions summary
         with open('review_summary.md', 'w') as f:
@@ -374,16 +715,9 @@ Found {len(issues)} medium/low priority issues during automated review.
         chunks = self.chunk_files_for_review(files)
         print(f"   Split into {len(chunks)} chunks for review")
         
-        # Review each chunk
-        all_issues = []
-        for i, chunk in enumerate(chunks, 1):
-            print(f"\\n🔍 Reviewing chunk {i}/{len(chunks)}...")
-            issues = self.review_chunk(chunk)
-            all_issues.extend(issues)
-            print(f"   Found {len(issues)} issues")
-            
-            # Rate limiting
-            time.sleep(5)
+        # Review chunks concurrently
+        print()
+        all_issues = self.deduplicate_issues(asyncio.run(self.review_chunks(chunks)))
         
         print(f"\\n📊 Total issues found: {len(all_issues)}")
         